@@ -1,30 +1,56 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Callable, Dict, List
 
+# Field and operator codes for vectorized threshold alerts
+_FIELDS = {'zscore': 0, 'price': 1, 'volume_ratio': 2}
+_OPS = {'above': 0, 'below': 1}
+
+
+class DataSnapshot:
+    """
+    Scalar view of the latest bar, computed once per alert sweep.
+
+    Conditions compare against these precomputed scalars instead of
+    re-slicing the DataFrame per alert per check.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        has_rows = len(data) > 0
+
+        self.last_price = float(data['price'].iat[-1]) if has_rows and 'price' in data.columns else None
+        self.last_zscore = float(data['zscore'].iat[-1]) if has_rows and 'zscore' in data.columns else None
+
+        if 'volume' in data.columns and len(data) >= 10:
+            avg_volume = data['volume'].iloc[-10:-1].mean()
+            self.volume_ratio = float(data['volume'].iat[-1] / avg_volume) if avg_volume else None
+        else:
+            self.volume_ratio = None
+
 
 class Alert:
     """Alert definition"""
-    
+
     def __init__(self, name: str, condition: Callable, message: str):
         self.name = name
         self.condition = condition  # Function that returns True when alert triggers
         self.message = message
         self.triggered_at = None
         self.active = True
-        
-    def check(self, data: pd.DataFrame) -> bool:
+
+    def check(self, snapshot: DataSnapshot) -> bool:
         """Check if alert condition is met"""
-        if not self.active or data.empty:
+        if not self.active:
             return False
-            
+
         try:
-            if self.condition(data):
+            if self.condition(snapshot):
                 self.triggered_at = datetime.now()
                 return True
         except Exception as e:
             print(f"Alert {self.name} error: {e}")
-            
+
         return False
 
 
@@ -34,26 +60,95 @@ class AlertEngine:
     def __init__(self):
         self.alerts: Dict[str, Alert] = {}
         self.triggered_alerts: List[Dict] = []
-        
+
+        # Parallel arrays for threshold alerts: the whole batch is
+        # evaluated with a single vector compare per sweep
+        self._threshold_names: List[str] = []
+        self._threshold_messages: List[str] = []
+        self._threshold_fields = np.empty(0, dtype=np.intp)
+        self._threshold_ops = np.empty(0, dtype=np.intp)
+        self._thresholds = np.empty(0, dtype=np.float64)
+        self._threshold_active = np.empty(0, dtype=bool)
+
     def add_alert(self, name: str, condition: Callable, message: str):
-        """Add a new alert"""
+        """Add a custom alert with a callable condition"""
         self.alerts[name] = Alert(name, condition, message)
-        
+
+    def add_threshold_alert(self, name: str, field: str, op: str, threshold: float, message: str):
+        """
+        Add a vectorized threshold alert.
+
+        Args:
+            name: Alert identifier
+            field: 'zscore', 'price', or 'volume_ratio'
+            op: 'above' or 'below'
+            threshold: Trigger level
+            message: Message recorded when the alert fires
+        """
+        self._threshold_names.append(name)
+        self._threshold_messages.append(message)
+        self._threshold_fields = np.append(self._threshold_fields, _FIELDS[field])
+        self._threshold_ops = np.append(self._threshold_ops, _OPS[op])
+        self._thresholds = np.append(self._thresholds, threshold)
+        self._threshold_active = np.append(self._threshold_active, True)
+
     def remove_alert(self, name: str):
         """Remove an alert"""
         if name in self.alerts:
             del self.alerts[name]
-            
+        elif name in self._threshold_names:
+            i = self._threshold_names.index(name)
+            del self._threshold_names[i]
+            del self._threshold_messages[i]
+            self._threshold_fields = np.delete(self._threshold_fields, i)
+            self._threshold_ops = np.delete(self._threshold_ops, i)
+            self._thresholds = np.delete(self._thresholds, i)
+            self._threshold_active = np.delete(self._threshold_active, i)
+
     def check_alerts(self, data: pd.DataFrame):
         """Check all alerts against current data"""
+        if data.empty or not (self.alerts or self._threshold_names):
+            return
+
+        # Extract last-bar scalars once; conditions only compare scalars
+        snapshot = DataSnapshot(data)
+
+        self._check_threshold_alerts(snapshot)
+
         for alert in self.alerts.values():
-            if alert.check(data):
+            if alert.check(snapshot):
                 self.triggered_alerts.append({
                     'name': alert.name,
                     'message': alert.message,
                     'timestamp': alert.triggered_at
                 })
                 alert.active = False  # One-time trigger
+
+    def _check_threshold_alerts(self, snapshot: DataSnapshot):
+        """Evaluate all threshold alerts with one vector compare"""
+        if not self._threshold_names:
+            return
+
+        field_values = np.array([
+            np.nan if snapshot.last_zscore is None else snapshot.last_zscore,
+            np.nan if snapshot.last_price is None else snapshot.last_price,
+            np.nan if snapshot.volume_ratio is None else snapshot.volume_ratio,
+        ])
+
+        values = field_values[self._threshold_fields]
+        fired = np.where(
+            self._threshold_ops == _OPS['above'],
+            values > self._thresholds,
+            values < self._thresholds,
+        ) & self._threshold_active
+
+        for i in np.nonzero(fired)[0]:
+            self.triggered_alerts.append({
+                'name': self._threshold_names[i],
+                'message': self._threshold_messages[i],
+                'timestamp': datetime.now()
+            })
+            self._threshold_active[i] = False  # One-time trigger
                 
     def get_triggered_alerts(self, limit=10):
         """Get recent triggered alerts"""
@@ -68,51 +163,41 @@ class AlertEngine:
         if name in self.alerts:
             self.alerts[name].active = True
             self.alerts[name].triggered_at = None
+        elif name in self._threshold_names:
+            self._threshold_active[self._threshold_names.index(name)] = True
 
 
-# Predefined alert conditions
+# Predefined alert conditions (operate on a DataSnapshot)
 def zscore_above(threshold: float):
     """Alert when z-score exceeds threshold"""
-    def condition(data: pd.DataFrame) -> bool:
-        if 'zscore' not in data.columns or data['zscore'].empty:
-            return False
-        return data['zscore'].iloc[-1] > threshold
+    def condition(snapshot: DataSnapshot) -> bool:
+        return snapshot.last_zscore is not None and snapshot.last_zscore > threshold
     return condition
 
 
 def zscore_below(threshold: float):
     """Alert when z-score below threshold"""
-    def condition(data: pd.DataFrame) -> bool:
-        if 'zscore' not in data.columns or data['zscore'].empty:
-            return False
-        return data['zscore'].iloc[-1] < threshold
+    def condition(snapshot: DataSnapshot) -> bool:
+        return snapshot.last_zscore is not None and snapshot.last_zscore < threshold
     return condition
 
 
 def price_above(threshold: float):
     """Alert when price exceeds threshold"""
-    def condition(data: pd.DataFrame) -> bool:
-        if 'price' not in data.columns or data['price'].empty:
-            return False
-        return data['price'].iloc[-1] > threshold
+    def condition(snapshot: DataSnapshot) -> bool:
+        return snapshot.last_price is not None and snapshot.last_price > threshold
     return condition
 
 
 def price_below(threshold: float):
     """Alert when price below threshold"""
-    def condition(data: pd.DataFrame) -> bool:
-        if 'price' not in data.columns or data['price'].empty:
-            return False
-        return data['price'].iloc[-1] < threshold
+    def condition(snapshot: DataSnapshot) -> bool:
+        return snapshot.last_price is not None and snapshot.last_price < threshold
     return condition
 
 
 def volume_spike(multiplier: float = 2.0):
     """Alert when volume spikes above rolling average"""
-    def condition(data: pd.DataFrame) -> bool:
-        if 'volume' not in data.columns or len(data) < 10:
-            return False
-        avg_volume = data['volume'].iloc[-10:-1].mean()
-        current_volume = data['volume'].iloc[-1]
-        return current_volume > avg_volume * multiplier
+    def condition(snapshot: DataSnapshot) -> bool:
+        return snapshot.volume_ratio is not None and snapshot.volume_ratio > multiplier
     return condition
@@ -0,0 +1,44 @@
+"""
+Streamlit-cached wrappers around the analytics pipeline.
+
+The dashboard reruns every couple of seconds; these wrappers key the
+heavy computations on cheap fingerprint tuples (length, last bar
+timestamp, last price) so refreshes where the data didn't change are
+cache lookups. Underscore-prefixed arguments are never hashed.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from analytics.stats import adf_test, compute_zscore, compute_returns_volatility
+
+
+def frame_fingerprint(bars: pd.DataFrame) -> tuple:
+    """
+    Cheap cache key for a bar frame.
+
+    The last price is included because a partial bar updates in place
+    without changing the row count or the last timestamp.
+    """
+    return (len(bars), int(bars.index[-1].value), float(bars['price'].iat[-1]))
+
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def cached_pipeline(fingerprint, _bars, window):
+    """Memoized z-score / returns / volatility over a bar frame"""
+    out = _bars.copy()
+    out['zscore'] = compute_zscore(out['price'], window=window)
+    out['returns'], out['volatility'] = compute_returns_volatility(out['price'], window=window)
+    return out
+
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def cached_adf(fingerprint, _series):
+    """Memoized ADF test over a price series"""
+    return adf_test(_series)
+
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def cached_pairs_results(fingerprint, _pairs, window):
+    """Memoized pairs analytics frame (spread, z-score, correlation)"""
+    return _pairs.compute_all(window=window)
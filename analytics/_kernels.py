@@ -0,0 +1,325 @@
+"""
+Numba-compiled kernels shared by the analytics modules.
+
+These are internal single-pass replacements for pandas rolling chains:
+each kernel walks its input array once instead of materializing
+intermediate Series per rolling operation.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def rolling_zscore(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    Rolling z-score in a single pass.
+
+    Maintains running sum and sum-of-squares over the window instead of
+    separate rolling mean/std sweeps. Uses sample variance (ddof=1) to
+    match pandas' rolling std. First w-1 outputs are NaN, as is any
+    window containing a NaN (matching pandas, the sums recover once
+    the NaN slides out).
+    """
+    n = x.size
+    out = np.empty(n, dtype=np.float64)
+
+    s = 0.0
+    s2 = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            s += v
+            s2 += v * v
+
+        if i >= w:
+            old = x[i - w]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+                s2 -= old * old
+
+        if i >= w - 1 and nan_count == 0:
+            mean = s / w
+            var = (s2 - s * s / w) / (w - 1)
+            if var > 0.0:
+                out[i] = (v - mean) / np.sqrt(var)
+            else:
+                out[i] = np.nan
+        else:
+            out[i] = np.nan
+
+    return out
+
+
+@njit(cache=True)
+def rolling_std_kernel(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    Rolling sample std in a single pass.
+
+    Same running-sums scheme as rolling_zscore; windows containing a
+    NaN emit NaN and the sums recover once it slides out.
+    """
+    n = x.size
+    out = np.empty(n, dtype=np.float64)
+
+    s = 0.0
+    s2 = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            s += v
+            s2 += v * v
+
+        if i >= w:
+            old = x[i - w]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+                s2 -= old * old
+
+        if i >= w - 1 and nan_count == 0:
+            var = (s2 - s * s / w) / (w - 1)
+            out[i] = np.sqrt(var) if var > 0.0 else 0.0
+        else:
+            out[i] = np.nan
+
+    return out
+
+
+@njit(cache=True)
+def returns_volatility_kernel(p: np.ndarray, w: int):
+    """
+    Log returns and their rolling annualized volatility in one pass.
+
+    Each return is computed once and folded straight into the rolling
+    sum/sum-of-squares, instead of materializing the return series and
+    sweeping it again for the rolling std. Windows containing a NaN
+    return (e.g. from a NaN price) emit NaN and the sums recover once
+    it slides out, like the sibling rolling kernels.
+    """
+    n = p.size
+    rets = np.full(n, np.nan)
+    vol = np.full(n, np.nan)
+
+    s = 0.0
+    s2 = 0.0
+    nan_count = 0
+    ann = np.sqrt(252.0)
+
+    for i in range(1, n):
+        r = np.log(p[i] / p[i - 1])
+        rets[i] = r
+        if np.isnan(r):
+            nan_count += 1
+        else:
+            s += r
+            s2 += r * r
+
+        if i > w:
+            old = rets[i - w]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+                s2 -= old * old
+
+        if i >= w and nan_count == 0:
+            var = (s2 - s * s / w) / (w - 1)
+            vol[i] = np.sqrt(var) * ann if var > 0.0 else 0.0
+
+    return rets, vol
+
+
+@njit(cache=True)
+def rolling_corr_kernel(x: np.ndarray, y: np.ndarray, w: int) -> np.ndarray:
+    """
+    Rolling Pearson correlation in a single O(n) pass.
+
+    Maintains the five running sums (Sx, Sy, Sxx, Syy, Sxy) as the
+    window slides instead of recomputing cov/std per window. Windows
+    containing a NaN in either series emit NaN and recover afterwards.
+    """
+    n = x.size
+    out = np.empty(n, dtype=np.float64)
+
+    sx = 0.0
+    sy = 0.0
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        xv = x[i]
+        yv = y[i]
+        if np.isnan(xv) or np.isnan(yv):
+            nan_count += 1
+        else:
+            sx += xv
+            sy += yv
+            sxx += xv * xv
+            syy += yv * yv
+            sxy += xv * yv
+
+        if i >= w:
+            xo = x[i - w]
+            yo = y[i - w]
+            if np.isnan(xo) or np.isnan(yo):
+                nan_count -= 1
+            else:
+                sx -= xo
+                sy -= yo
+                sxx -= xo * xo
+                syy -= yo * yo
+                sxy -= xo * yo
+
+        if i >= w - 1 and nan_count == 0:
+            cov = w * sxy - sx * sy
+            var_x = w * sxx - sx * sx
+            var_y = w * syy - sy * sy
+            denom = np.sqrt(var_x * var_y)
+            out[i] = cov / denom if denom > 0.0 else np.nan
+        else:
+            out[i] = np.nan
+
+    return out
+
+
+@njit(cache=True)
+def max_drawdown_kernel(p: np.ndarray) -> float:
+    """
+    Maximum drawdown in a single sweep.
+
+    Tracks the running peak and the worst peak-to-trough ratio instead
+    of the pct_change -> cumprod -> expanding-max chain (three passes
+    and three temporaries).
+    """
+    if p.size == 0:
+        return np.nan
+
+    peak = p[0]
+    mdd = 0.0
+
+    for i in range(1, p.size):
+        if p[i] > peak:
+            peak = p[i]
+        dd = p[i] / peak - 1.0
+        if dd < mdd:
+            mdd = dd
+
+    return mdd
+
+
+@njit(cache=True)
+def mean_std_kernel(x: np.ndarray):
+    """NaN-skipping mean and sample std computed in one pass."""
+    n = 0
+    s = 0.0
+    s2 = 0.0
+
+    for i in range(x.size):
+        v = x[i]
+        if not np.isnan(v):
+            n += 1
+            s += v
+            s2 += v * v
+
+    if n == 0:
+        return np.nan, np.nan
+
+    mean = s / n
+    if n < 2:
+        return mean, np.nan
+
+    var = (s2 - s * s / n) / (n - 1)
+    std = np.sqrt(var) if var > 0.0 else 0.0
+    return mean, std
+
+
+@njit(cache=True)
+def summary_stats_kernel(x: np.ndarray):
+    """
+    Count, mean, sample std, min, max, skew, and excess kurtosis in a
+    single NaN-skipping Welford pass (online central moments M2..M4),
+    instead of one full sweep per statistic.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    mn = np.inf
+    mx = -np.inf
+
+    for i in range(x.size):
+        v = x[i]
+        if np.isnan(v):
+            continue
+
+        n += 1
+        delta = v - mean
+        dn = delta / n
+        dn2 = dn * dn
+        term1 = delta * dn * (n - 1)
+
+        mean += dn
+        m4 += term1 * dn2 * (n * n - 3 * n + 3) + 6.0 * dn2 * m2 - 4.0 * dn * m3
+        m3 += term1 * dn * (n - 2) - 3.0 * dn * m2
+        m2 += term1
+
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+
+    if n == 0:
+        return 0, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan
+
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+
+    if m2 > 0.0:
+        # Biased moment estimators, matching scipy's defaults
+        skew = np.sqrt(n) * m3 / m2 ** 1.5
+        kurt = n * m4 / (m2 * m2) - 3.0
+    else:
+        skew = np.nan
+        kurt = np.nan
+
+    return n, mean, std, mn, mx, skew, kurt
+
+
+@njit(cache=True)
+def signals_kernel(z: np.ndarray, entry_threshold: float, exit_threshold: float) -> np.ndarray:
+    """Stateful entry/exit loop compiled to native code (NaN carries position)."""
+    out = np.empty(z.size, dtype=np.int8)
+    position = 0
+
+    for i in range(z.size):
+        zi = z[i]
+
+        if not np.isnan(zi):
+            # Entry logic
+            if position == 0:
+                if zi > entry_threshold:
+                    position = -1  # Short (mean reversion)
+                elif zi < -entry_threshold:
+                    position = 1   # Long
+
+            # Exit logic
+            elif abs(zi) < exit_threshold:
+                position = 0
+
+        out[i] = position
+
+    return out
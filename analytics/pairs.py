@@ -1,8 +1,9 @@
 import pandas as pd
 import numpy as np
-from statsmodels.tsa.stattools import adfuller
-from statsmodels.regression.linear_model import OLS
-from statsmodels.tools import add_constant
+import numexpr as ne
+
+from analytics._kernels import rolling_zscore, signals_kernel
+from analytics.stats import adf_maxlag1, rolling_corr
 
 
 class PairsTradingAnalytics:
@@ -23,29 +24,105 @@ class PairsTradingAnalytics:
         self.hedge_ratio = None
         self.spread = None
         self.zscore = None
-        
+
+        # Running sums for the streaming hedge-ratio update
+        self._n = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+
+    def update(self, new_y, new_x):
+        """
+        Fold new observations into the running hedge-ratio accumulators.
+
+        Keeps beta current in O(1) per new bar instead of refitting OLS
+        over the full history on every refresh.
+
+        Args:
+            new_y: New dependent observations (scalar or array)
+            new_x: New independent observations (scalar or array)
+
+        Returns:
+            Updated hedge ratio
+        """
+        y = np.atleast_1d(np.asarray(new_y, dtype=np.float64))
+        x = np.atleast_1d(np.asarray(new_x, dtype=np.float64))
+        mask = ~(np.isnan(x) | np.isnan(y))
+        x = x[mask]
+        y = y[mask]
+
+        if x.size == 0:
+            return self.hedge_ratio
+
+        self._n += x.size
+        self._sum_x += x.sum()
+        self._sum_y += y.sum()
+        self._sum_xx += x @ x
+        self._sum_xy += x @ y
+
+        denom = self._n * self._sum_xx - self._sum_x * self._sum_x
+        if self._n >= 2 and denom:
+            self.hedge_ratio = (self._n * self._sum_xy - self._sum_x * self._sum_y) / denom
+
+        return self.hedge_ratio
+
     def compute_hedge_ratio(self):
-        """Compute OLS hedge ratio"""
-        x = add_constant(self.price_x)
-        model = OLS(self.price_y, x).fit()
-        self.hedge_ratio = model.params[1]
+        """Compute OLS hedge ratio in closed form (beta = cov(x, y) / var(x))"""
+        return self._compute_hedge_ratio_np(
+            np.ascontiguousarray(self.price_y.to_numpy(dtype=np.float64)),
+            np.ascontiguousarray(self.price_x.to_numpy(dtype=np.float64)),
+        )
+
+    def _compute_hedge_ratio_np(self, y: np.ndarray, x: np.ndarray):
+        """Array-level hedge ratio fit; seeds the streaming accumulators"""
+        mask = ~(np.isnan(x) | np.isnan(y))
+        x = x[mask]
+        y = y[mask]
+
+        if x.size < 2:
+            self.hedge_ratio = 1.0
+            return self.hedge_ratio
+
+        x_dev = x - x.mean()
+        y_dev = y - y.mean()
+        denom = x_dev @ x_dev
+        self.hedge_ratio = (x_dev @ y_dev) / denom if denom else 1.0
+
+        # Seed the streaming accumulators from the same sample so that
+        # update() continues from this fit
+        self._n = x.size
+        self._sum_x = x.sum()
+        self._sum_y = y.sum()
+        self._sum_xx = x @ x
+        self._sum_xy = x @ y
+
         return self.hedge_ratio
     
+    def _spread_np(self, y: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Array-level spread; numexpr fuses the multiply-subtract"""
+        h = self.hedge_ratio
+        return ne.evaluate('y - h * x')
+
     def compute_spread(self):
-        """Compute spread using hedge ratio"""
+        """Compute spread using hedge ratio (fused multiply-subtract)"""
         if self.hedge_ratio is None:
             self.compute_hedge_ratio()
-        self.spread = self.price_y - self.hedge_ratio * self.price_x
+
+        spread = self._spread_np(
+            np.ascontiguousarray(self.price_y.to_numpy(dtype=np.float64)),
+            np.ascontiguousarray(self.price_x.to_numpy(dtype=np.float64)),
+        )
+        self.spread = pd.Series(spread, index=self.price_y.index)
         return self.spread
-    
+
     def compute_zscore(self, window=20):
-        """Compute rolling z-score of spread"""
+        """Compute rolling z-score of spread (fused single-pass kernel)"""
         if self.spread is None:
             self.compute_spread()
-            
-        mean = self.spread.rolling(window=window).mean()
-        std = self.spread.rolling(window=window).std()
-        self.zscore = (self.spread - mean) / std
+
+        z = rolling_zscore(self.spread.to_numpy(dtype=np.float64), window)
+        self.zscore = pd.Series(z, index=self.spread.index)
         return self.zscore
     
     def adf_test(self, spread=None):
@@ -71,73 +148,74 @@ class PairsTradingAnalytics:
                 'message': 'Insufficient data for ADF test'
             }
         
-        result = adfuller(spread_clean, maxlag=1)
-        
+        statistic, pvalue, critical_values = adf_maxlag1(
+            spread_clean.to_numpy(dtype=np.float64)
+        )
+
         return {
-            'test_statistic': result[0],
-            'p_value': result[1],
-            'critical_values': result[4],
-            'is_stationary': result[1] < 0.05,  # 5% significance level
-            'message': 'Stationary' if result[1] < 0.05 else 'Non-stationary'
+            'test_statistic': statistic,
+            'p_value': pvalue,
+            'critical_values': critical_values,
+            'is_stationary': pvalue < 0.05,  # 5% significance level
+            'message': 'Stationary' if pvalue < 0.05 else 'Non-stationary'
         }
     
     def rolling_correlation(self, window=20):
         """Compute rolling correlation between two series"""
-        return self.price_y.rolling(window).corr(self.price_x)
+        return rolling_corr(self.price_y, self.price_x, window=window)
     
     def compute_all(self, window=20):
         """
         Compute all analytics and return as DataFrame.
-        
+
+        Converts both price series to contiguous float64 arrays once
+        and runs the whole pipeline on ndarrays, wrapping back into
+        pandas only for the final frame.
+
         Returns:
             DataFrame with spread, z-score, correlation
         """
-        self.compute_hedge_ratio()
-        self.compute_spread()
-        zscore = self.compute_zscore(window)
+        y = np.ascontiguousarray(self.price_y.to_numpy(dtype=np.float64))
+        x = np.ascontiguousarray(self.price_x.to_numpy(dtype=np.float64))
+
+        if self.hedge_ratio is None:
+            self._compute_hedge_ratio_np(y, x)
+
+        spread = self._spread_np(y, x)
+        zscore = rolling_zscore(spread, window)
         correlation = self.rolling_correlation(window)
-        
+
+        index = self.price_y.index
+        self.spread = pd.Series(spread, index=index)
+        self.zscore = pd.Series(zscore, index=index)
+
         df = pd.DataFrame({
             'price_y': self.price_y,
             'price_x': self.price_x,
             'spread': self.spread,
-            'zscore': zscore,
+            'zscore': self.zscore,
             'correlation': correlation
         })
-        
+
         return df
 
 
 def generate_trading_signals(zscore: pd.Series, entry_threshold=2.0, exit_threshold=0.5):
     """
     Generate simple mean-reversion trading signals.
-    
+
     Args:
         zscore: Z-score series
         entry_threshold: Enter position when |zscore| > this
         exit_threshold: Exit position when |zscore| < this
-        
+
     Returns:
-        DataFrame with signals (-1: short, 0: neutral, 1: long)
+        int8 Series with signals (-1: short, 0: neutral, 1: long)
     """
-    signals = pd.Series(0, index=zscore.index)
-    position = 0
-    
-    for i in range(len(zscore)):
-        z = zscore.iloc[i]
-        
-        # Entry logic
-        if position == 0:
-            if z > entry_threshold:
-                position = -1  # Short (mean reversion)
-            elif z < -entry_threshold:
-                position = 1   # Long
-                
-        # Exit logic
-        elif position != 0:
-            if abs(z) < exit_threshold:
-                position = 0
-                
-        signals.iloc[i] = position
-    
-    return signals
+    signals = signals_kernel(
+        zscore.to_numpy(dtype=np.float64),
+        entry_threshold,
+        exit_threshold
+    )
+
+    return pd.Series(signals, index=zscore.index)
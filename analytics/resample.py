@@ -1,29 +1,41 @@
 import pandas as pd
 
+# Bucket width in nanoseconds per supported timeframe
+_NS_PER_BUCKET = {
+    "1s": 1_000_000_000,
+    "1m": 60 * 1_000_000_000,
+    "5m": 5 * 60 * 1_000_000_000,
+}
+
 
 def resample_ticks(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
     """
     Resample tick data into time bars.
 
-    timeframe: '1s', '1min', '5min'
+    timeframe: '1s', '1m', '5m'
+
+    Buckets are computed directly on the int64 nanosecond timestamps and
+    aggregated with groupby, which skips pandas' resample binning
+    machinery and never materializes empty bins (so no dropna pass).
     """
 
     if df.empty:
         return df
 
-    rule_map = {
-        "1s": "1S",
-        "1m": "1min",
-        "5m": "5min",
-    }
-
-    rule = rule_map.get(timeframe)
-    if rule is None:
+    bucket_ns = _NS_PER_BUCKET.get(timeframe)
+    if bucket_ns is None:
         raise ValueError("Invalid timeframe")
 
-    resampled = df.resample(rule).agg(
-        price=("price", "last"),
-        volume=("qty", "sum"),
-    )
+    # Normalize to nanoseconds first: the index unit depends on the
+    # source (DuckDB hands back microseconds)
+    buckets = df.index.astype("datetime64[ns]").astype("int64") // bucket_ns
+    grouped = df.groupby(buckets, sort=False)
+
+    resampled = pd.DataFrame({
+        "price": grouped["price"].last(),
+        "volume": grouped["qty"].sum(),
+    })
+    resampled.index = pd.to_datetime(resampled.index * bucket_ns)
+    resampled.index.name = df.index.name
 
-    return resampled.dropna()
+    return resampled
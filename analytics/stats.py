@@ -1,9 +1,13 @@
 import pandas as pd
 import numpy as np
-from statsmodels.regression.linear_model import OLS
-from statsmodels.tools import add_constant
 from statsmodels.tsa.stattools import adfuller
-from scipy import stats as scipy_stats
+from statsmodels.tsa.adfvalues import mackinnonp, mackinnoncrit
+
+from analytics._kernels import (
+    rolling_zscore, rolling_std_kernel, rolling_corr_kernel,
+    max_drawdown_kernel, mean_std_kernel, returns_volatility_kernel,
+    summary_stats_kernel
+)
 
 
 def compute_spread(price1, price2, hedge_ratio=None):
@@ -32,18 +36,21 @@ def compute_zscore(series, window=None):
         return pd.Series()
     
     if window:
-        mean = series.rolling(window=window).mean()
-        std = series.rolling(window=window).std()
-    else:
-        mean = series.mean()
-        std = series.std()
-    
-    return (series - mean) / std
+        # Single fused pass instead of separate rolling mean/std sweeps
+        z = rolling_zscore(series.to_numpy(dtype=np.float64), window)
+        return pd.Series(z, index=series.index)
+
+    return (series - series.mean()) / series.std()
 
 
 def rolling_corr(series1, series2, window=10):
-    """Compute rolling correlation"""
-    return series1.rolling(window).corr(series2)
+    """Compute rolling correlation (single-pass running-sums kernel)"""
+    corr = rolling_corr_kernel(
+        series1.to_numpy(dtype=np.float64),
+        series2.to_numpy(dtype=np.float64),
+        window
+    )
+    return pd.Series(corr, index=series1.index)
 
 
 def hedge_ratio(price_y, price_x):
@@ -57,28 +64,63 @@ def hedge_ratio(price_y, price_x):
     Returns:
         Hedge ratio (beta)
     """
-    # Remove NaN values
-    mask = ~(price_y.isna() | price_x.isna())
-    y = price_y[mask]
-    x = price_x[mask]
-    
+    # Remove NaN values with one fused NumPy mask (no pandas dispatch)
+    y = price_y.to_numpy(dtype=np.float64)
+    x = price_x.to_numpy(dtype=np.float64)
+    mask = ~(np.isnan(y) | np.isnan(x))
+    y = y[mask]
+    x = x[mask]
+
     if len(x) < 2:
         return 1.0
-    
-    x_with_const = add_constant(x)
-    model = OLS(y, x_with_const).fit()
-    return model.params[1]
+
+    # Closed-form single-regressor OLS: beta = cov(x, y) / var(x)
+    x_dev = x - x.mean()
+    y_dev = y - y.mean()
+    denom = x_dev @ x_dev
+    return (x_dev @ y_dev) / denom if denom else 1.0
+
+
+def adf_maxlag1(y: np.ndarray):
+    """
+    Closed-form ADF test for maxlag=1 (constant, no trend).
+
+    Runs the Dickey-Fuller regression dy_t = a + rho*y_{t-1} + phi*dy_{t-1}
+    directly via the normal equations and looks the p-value up in the
+    MacKinnon tables, skipping statsmodels' model/result machinery.
+
+    Returns:
+        (statistic, pvalue, critical_values dict)
+    """
+    dy = np.diff(y)
+    dep = dy[1:]
+    X = np.column_stack((y[1:-1], dy[:-1], np.ones(dep.size)))
+
+    xtx = X.T @ X
+    beta = np.linalg.solve(xtx, X.T @ dep)
+    resid = dep - X @ beta
+
+    dof = dep.size - 3
+    sigma2 = (resid @ resid) / dof
+    se_rho = np.sqrt(sigma2 * np.linalg.inv(xtx)[0, 0])
+
+    statistic = beta[0] / se_rho
+    pvalue = mackinnonp(statistic, regression='c', N=1)
+    crit = mackinnoncrit(N=1, regression='c', nobs=dep.size)
+    critical_values = {'1%': crit[0], '5%': crit[1], '10%': crit[2]}
+
+    return statistic, pvalue, critical_values
 
 
 def adf_test(series, maxlag=1):
     """
     Augmented Dickey-Fuller test for stationarity.
-    
+
     Returns:
         Dictionary with test results
     """
     series_clean = series.dropna()
-    
+
     if len(series_clean) < 10:
         return {
             'statistic': None,
@@ -86,14 +128,20 @@ def adf_test(series, maxlag=1):
             'critical_values': {},
             'is_stationary': False
         }
-    
-    result = adfuller(series_clean, maxlag=maxlag)
-    
+
+    if maxlag == 1:
+        statistic, pvalue, critical_values = adf_maxlag1(
+            series_clean.to_numpy(dtype=np.float64)
+        )
+    else:
+        result = adfuller(series_clean, maxlag=maxlag)
+        statistic, pvalue, critical_values = result[0], result[1], result[4]
+
     return {
-        'statistic': result[0],
-        'pvalue': result[1],
-        'critical_values': result[4],
-        'is_stationary': result[1] < 0.05
+        'statistic': statistic,
+        'pvalue': pvalue,
+        'critical_values': critical_values,
+        'is_stationary': pvalue < 0.05
     }
 
 
@@ -104,7 +152,22 @@ def compute_returns(prices):
 
 def compute_volatility(returns, window=20):
     """Compute rolling volatility (annualized)"""
-    return returns.rolling(window).std() * np.sqrt(252)
+    std = rolling_std_kernel(returns.to_numpy(dtype=np.float64), window)
+    return pd.Series(std * np.sqrt(252), index=returns.index)
+
+
+def compute_returns_volatility(prices, window=20):
+    """
+    Compute log returns and rolling annualized volatility together.
+
+    Fused single-pass version of compute_returns + compute_volatility
+    for the per-refresh dashboard pipeline.
+
+    Returns:
+        Tuple of (returns, volatility) Series
+    """
+    rets, vol = returns_volatility_kernel(prices.to_numpy(dtype=np.float64), window)
+    return pd.Series(rets, index=prices.index), pd.Series(vol, index=prices.index)
 
 
 def sharpe_ratio(returns, risk_free_rate=0.0):
@@ -115,38 +178,42 @@ def sharpe_ratio(returns, risk_free_rate=0.0):
         returns: Return series
         risk_free_rate: Annual risk-free rate
     """
-    excess_returns = returns - risk_free_rate / 252
-    return np.sqrt(252) * excess_returns.mean() / returns.std()
+    # Fused single pass for mean and std of the return series
+    mean, std = mean_std_kernel(returns.to_numpy(dtype=np.float64))
+    return np.sqrt(252) * (mean - risk_free_rate / 252) / std
 
 
 def max_drawdown(prices):
     """
     Compute maximum drawdown.
-    
+
     Returns:
         Maximum drawdown as percentage
     """
-    cumulative = (1 + prices.pct_change()).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    return drawdown.min()
+    return max_drawdown_kernel(prices.to_numpy(dtype=np.float64))
 
 
 def compute_summary_stats(series):
     """
     Compute comprehensive summary statistics.
-    
+
+    All moments come from one fused pass; only the median needs its
+    own (partial-sort) step.
+
     Returns:
         Dictionary with statistics
     """
+    x = series.to_numpy(dtype=np.float64)
+    n, mean, std, mn, mx, skew, kurtosis = summary_stats_kernel(x)
+
     return {
         'count': len(series),
-        'mean': series.mean(),
-        'std': series.std(),
-        'min': series.min(),
-        'max': series.max(),
-        'median': series.median(),
-        'skew': scipy_stats.skew(series.dropna()),
-        'kurtosis': scipy_stats.kurtosis(series.dropna())
+        'mean': mean,
+        'std': std,
+        'min': mn,
+        'max': mx,
+        'median': float(np.nanmedian(x)) if n else np.nan,
+        'skew': skew,
+        'kurtosis': kurtosis
     }
 
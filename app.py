@@ -2,21 +2,17 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import time
 from datetime import datetime, timedelta
 
-from ingestion.binance_ws import BinanceWebSocket
+from ingestion.binance_ws import get_client
 from storage.store import TickStore, ticks_to_dataframe
 from analytics.resample import resample_ticks
-from analytics.stats import (
-    compute_zscore, adf_test, compute_summary_stats,
-    rolling_corr, compute_volatility, compute_returns
+from analytics.stats import compute_summary_stats
+from analytics._cached import (
+    frame_fingerprint, cached_pipeline, cached_adf, cached_pairs_results
 )
 from analytics.pairs import PairsTradingAnalytics, generate_trading_signals
-from alerts.alert_engine import (
-    AlertEngine, zscore_above, zscore_below, 
-    price_above, price_below, volume_spike
-)
+from alerts.alert_engine import AlertEngine
 
 # Page configuration
 st.set_page_config(
@@ -41,6 +37,119 @@ if "alert_engine" not in st.session_state:
     st.session_state.alert_engine = AlertEngine()
 if "last_update" not in st.session_state:
     st.session_state.last_update = datetime.now()
+if "resampled_cache" not in st.session_state:
+    st.session_state.resampled_cache = {}
+if "pairs_analytics" not in st.session_state:
+    st.session_state.pairs_analytics = {}
+
+# Cap on bars kept per (symbol, timeframe) in the incremental cache
+RESAMPLE_RETENTION_BARS = 5000
+
+# Cap on bars serialized to the browser per chart refresh
+MAX_CHART_BARS = 500
+
+
+def get_resampled(db_symbol, timeframe):
+    """
+    Return resampled bars for a symbol, maintained incrementally.
+
+    The resampled frame persists in session state; on each refresh only
+    ticks from the last (possibly partial) bar onwards are fetched and
+    resampled, so per-refresh cost is O(new ticks) instead of O(history).
+    """
+    key = (db_symbol, timeframe)
+    entry = st.session_state.resampled_cache.get(key)
+
+    if entry is None or entry.empty:
+        # Cold load: aggregate inside DuckDB so only bars cross the
+        # boundary, not thousands of raw ticks
+        bars = st.session_state.db.get_resampled(
+            db_symbol, timeframe, limit=RESAMPLE_RETENTION_BARS
+        )
+        if bars.empty:
+            return pd.DataFrame()
+    else:
+        # Re-fetch from the start of the last cached bar: it may still be partial
+        df = st.session_state.db.get_ticks(db_symbol, start_time=entry.index[-1])
+        if df.empty:
+            return entry
+        new_bars = resample_ticks(df.set_index('timestamp'), timeframe)
+        bars = pd.concat([entry[entry.index < new_bars.index[0]], new_bars])
+
+    if len(bars) > RESAMPLE_RETENTION_BARS:
+        bars = bars.iloc[-RESAMPLE_RETENTION_BARS:]
+
+    st.session_state.resampled_cache[key] = bars
+    return bars
+
+
+def build_chart_skeleton(symbol):
+    """
+    Empty price/z-score/volume figure for a symbol.
+
+    Built once per symbol and kept in session state; refreshes only
+    swap the trace arrays instead of re-running figure construction
+    and schema validation every time.
+    """
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=(f'{symbol.upper()} Price', 'Z-Score', 'Volume'),
+        vertical_spacing=0.1,
+        row_heights=[0.5, 0.25, 0.25]
+    )
+
+    fig.add_trace(
+        go.Scatter(mode='lines', name='Price', line=dict(color='#00ff00', width=2)),
+        row=1, col=1
+    )
+    fig.add_trace(
+        go.Scatter(mode='lines', name='Z-Score', line=dict(color='#ff9900', width=2)),
+        row=2, col=1
+    )
+
+    # Threshold lines
+    fig.add_hline(y=2, line_dash="dash", line_color="red", row=2, col=1)
+    fig.add_hline(y=-2, line_dash="dash", line_color="red", row=2, col=1)
+    fig.add_hline(y=0, line_dash="dot", line_color="gray", row=2, col=1)
+
+    fig.add_trace(
+        go.Bar(name='Volume', marker_color='#3399ff'),
+        row=3, col=1
+    )
+
+    fig.update_layout(
+        height=800,
+        showlegend=True,
+        hovermode='x unified',
+        template='plotly_dark'
+    )
+
+    fig.update_xaxes(title_text="Time", row=3, col=1)
+    fig.update_yaxes(title_text="Price", row=1, col=1)
+    fig.update_yaxes(title_text="Z-Score", row=2, col=1)
+    fig.update_yaxes(title_text="Volume", row=3, col=1)
+
+    return fig
+
+
+def build_pairs_skeleton():
+    """Empty spread/z-score figure for the pairs tab"""
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Spread', 'Z-Score'),
+        vertical_spacing=0.15
+    )
+
+    fig.add_trace(go.Scatter(mode='lines', name='Spread'), row=1, col=1)
+    fig.add_trace(go.Scatter(mode='lines', name='Z-Score'), row=2, col=1)
+
+    fig.add_hline(y=2, line_dash="dash", line_color="red", row=2, col=1)
+    fig.add_hline(y=-2, line_dash="dash", line_color="red", row=2, col=1)
+
+    fig.update_layout(height=600, template='plotly_dark')
+
+    return fig
+
 
 # Title
 st.title("📊 Live Quant Analytics Dashboard")
@@ -60,12 +169,11 @@ if mode == "Live Stream":
     )
     symbols = [s.strip().lower() for s in symbols_input.split(",")]
     
-    # Start WebSocket streams
+    # Attach to the shared WebSocket streams (started once per symbol,
+    # owned by the ingestion module rather than this session)
     for symbol in symbols:
         if symbol not in st.session_state.ws_clients:
-            ws = BinanceWebSocket()
-            ws.start(symbol)
-            st.session_state.ws_clients[symbol] = ws
+            st.session_state.ws_clients[symbol] = get_client(symbol, store=st.session_state.db)
             st.sidebar.success(f"Started {symbol} stream")
             
 else:
@@ -78,20 +186,27 @@ else:
     if uploaded_file:
         df_upload = pd.read_csv(uploaded_file)
         df_upload['timestamp'] = pd.to_datetime(df_upload['timestamp'])
-        
-        # Convert OHLC to tick-like format (using close price)
-        ticks_from_upload = []
-        for _, row in df_upload.iterrows():
-            ticks_from_upload.append({
-                'timestamp': row['timestamp'],
-                'symbol': row.get('symbol', 'UPLOADED'),
-                'price': row['close'],
-                'qty': row.get('volume', 0)
-            })
-        
-        st.session_state.db.insert_ticks(ticks_from_upload)
-        st.sidebar.success(f"Uploaded {len(ticks_from_upload)} records")
-        symbols = df_upload['symbol'].unique().tolist() if 'symbol' in df_upload.columns else ['UPLOADED']
+
+        # Convert OHLC to tick-like format (using close price) with
+        # column-wise ops; iterrows on a large upload is a known trap
+        df_upload = df_upload.rename(columns={'close': 'price', 'volume': 'qty'})
+        if 'symbol' not in df_upload.columns:
+            df_upload['symbol'] = 'UPLOADED'
+        if 'qty' not in df_upload.columns:
+            df_upload['qty'] = 0.0
+
+        st.session_state.db.insert_dataframe(df_upload[['timestamp', 'symbol', 'price', 'qty']])
+
+        # Uploaded rows may land inside or before bars already in the
+        # incremental cache, which only ever extends forward; drop the
+        # affected symbols' entries so they rebuild from the database
+        uploaded_symbols = set(df_upload['symbol'].unique())
+        for cache_key in list(st.session_state.resampled_cache):
+            if cache_key[0] in uploaded_symbols:
+                del st.session_state.resampled_cache[cache_key]
+
+        st.sidebar.success(f"Uploaded {len(df_upload)} records")
+        symbols = df_upload['symbol'].unique().tolist()
 
 # Analytics Controls
 st.sidebar.subheader("Analytics Parameters")
@@ -136,286 +251,262 @@ if alert_type != "None":
         alert_name = f"{alert_type}_{datetime.now().strftime('%H%M%S')}"
         
         if alert_type == "Z-Score Above":
-            st.session_state.alert_engine.add_alert(
-                alert_name,
-                zscore_above(alert_threshold),
+            st.session_state.alert_engine.add_threshold_alert(
+                alert_name, 'zscore', 'above', alert_threshold,
                 f"Z-Score exceeded {alert_threshold}"
             )
         elif alert_type == "Z-Score Below":
-            st.session_state.alert_engine.add_alert(
-                alert_name,
-                zscore_below(-alert_threshold),
+            st.session_state.alert_engine.add_threshold_alert(
+                alert_name, 'zscore', 'below', -alert_threshold,
                 f"Z-Score below {-alert_threshold}"
             )
         elif alert_type == "Price Above":
-            st.session_state.alert_engine.add_alert(
-                alert_name,
-                price_above(alert_threshold),
+            st.session_state.alert_engine.add_threshold_alert(
+                alert_name, 'price', 'above', alert_threshold,
                 f"Price exceeded {alert_threshold}"
             )
         elif alert_type == "Price Below":
-            st.session_state.alert_engine.add_alert(
-                alert_name,
-                price_below(alert_threshold),
+            st.session_state.alert_engine.add_threshold_alert(
+                alert_name, 'price', 'below', alert_threshold,
                 f"Price below {alert_threshold}"
             )
         elif alert_type == "Volume Spike":
-            st.session_state.alert_engine.add_alert(
-                alert_name,
-                volume_spike(2.0),
+            st.session_state.alert_engine.add_threshold_alert(
+                alert_name, 'volume_ratio', 'above', 2.0,
                 "Volume spike detected"
             )
-        
+
         st.sidebar.success(f"Alert added: {alert_name}")
 
 # Auto-refresh
 refresh_rate = st.sidebar.slider("Refresh Rate (seconds)", 1, 10, 2)
 
+# Adaptive refresh: while no new ticks arrive the render timers back
+# off exponentially up to this cap, instead of re-querying DuckDB for
+# every tab at full rate through quiet periods
+IDLE_REFRESH_CAP_S = 30
+
+if "idle_refreshes" not in st.session_state:
+    st.session_state.idle_refreshes = 0
+
+effective_refresh = min(
+    refresh_rate * (2 ** st.session_state.idle_refreshes), IDLE_REFRESH_CAP_S
+)
+
+
+def update_idle_backoff(drained: bool):
+    """Re-arm the render timers when the stream goes quiet or resumes"""
+    idle = st.session_state.idle_refreshes
+    new_idle = 0 if drained else min(idle + 1, 6)
+    st.session_state.idle_refreshes = new_idle
+
+    old_interval = min(refresh_rate * (2 ** idle), IDLE_REFRESH_CAP_S)
+    new_interval = min(refresh_rate * (2 ** new_idle), IDLE_REFRESH_CAP_S)
+    if new_interval != old_interval:
+        # Full rerun redefines the fragments with the new interval
+        st.rerun(scope="app")
+
 # Main Dashboard
 tab1, tab2, tab3, tab4 = st.tabs(["📈 Charts", "📊 Analytics", "🔔 Alerts", "💾 Data Export"])
 
-with tab1:
-    st.header("Real-Time Charts")
-    
-    # Collect latest data
+
+@st.fragment(run_every=refresh_rate)
+def monitor_stream():
+    """
+    Track stream activity to drive the adaptive refresh backoff.
+
+    Ingestion itself happens on the collectors' own flush timers; the
+    UI only watches the tick counters.
+    """
     if mode == "Live Stream":
-        for symbol, ws_client in st.session_state.ws_clients.items():
-            new_ticks = ws_client.get_ticks()
-            if new_ticks:
-                # Only insert new ticks since last update
-                last_count = len(new_ticks) - 100  # Get last 100
-                if last_count > 0:
-                    st.session_state.db.insert_ticks(new_ticks[last_count:])
-    
+        total = sum(ws.tick_count() for ws in st.session_state.ws_clients.values())
+        update_idle_backoff(total != st.session_state.get('last_total_ticks'))
+        st.session_state.last_total_ticks = total
+
+
+@st.fragment(run_every=effective_refresh)
+def render_charts():
     # Display charts for each symbol
     for symbol in symbols[:2]:  # Limit to 2 symbols for layout
         st.subheader(f"{symbol.upper()}")
-        
-        # Get data from database
-        df = st.session_state.db.get_latest_ticks(symbol.upper() if mode == "Live Stream" else symbol, limit=5000)
-        
-        if df.empty:
-            st.warning(f"No data available for {symbol}. Waiting for stream...")
-            continue
-        
-        # Set timestamp as index
-        df = df.set_index('timestamp')
-        
-        # Resample
+
         try:
-            resampled = resample_ticks(df, timeframe)
-            
+            resampled = get_resampled(symbol.upper() if mode == "Live Stream" else symbol, timeframe)
+
             if resampled.empty:
-                st.warning(f"No resampled data for {symbol}")
+                st.warning(f"No data available for {symbol}. Waiting for stream...")
                 continue
-            
-            # Compute analytics
-            resampled['zscore'] = compute_zscore(resampled['price'], window=rolling_window)
-            resampled['returns'] = compute_returns(resampled['price'])
-            resampled['volatility'] = compute_volatility(resampled['returns'], window=rolling_window)
-            
+
+            # Compute analytics, memoized on a cheap fingerprint so an
+            # idle market doesn't pay for recomputation every refresh
+            fingerprint = (symbol, timeframe, rolling_window) + frame_fingerprint(resampled)
+            resampled = cached_pipeline(fingerprint, resampled, rolling_window)
+
             # Check alerts
             st.session_state.alert_engine.check_alerts(resampled)
-            
-            # Create subplots
-            fig = make_subplots(
-                rows=3, cols=1,
-                subplot_titles=(f'{symbol.upper()} Price', 'Z-Score', 'Volume'),
-                vertical_spacing=0.1,
-                row_heights=[0.5, 0.25, 0.25]
-            )
-            
-            # Price chart
-            fig.add_trace(
-                go.Scatter(
-                    x=resampled.index,
-                    y=resampled['price'],
-                    mode='lines',
-                    name='Price',
-                    line=dict(color='#00ff00', width=2)
-                ),
-                row=1, col=1
-            )
-            
-            # Z-Score
-            fig.add_trace(
-                go.Scatter(
-                    x=resampled.index,
-                    y=resampled['zscore'],
-                    mode='lines',
-                    name='Z-Score',
-                    line=dict(color='#ff9900', width=2)
-                ),
-                row=2, col=1
-            )
-            
-            # Add threshold lines
-            fig.add_hline(y=2, line_dash="dash", line_color="red", row=2, col=1)
-            fig.add_hline(y=-2, line_dash="dash", line_color="red", row=2, col=1)
-            fig.add_hline(y=0, line_dash="dot", line_color="gray", row=2, col=1)
-            
-            # Volume
-            fig.add_trace(
-                go.Bar(
-                    x=resampled.index,
-                    y=resampled['volume'],
-                    name='Volume',
-                    marker_color='#3399ff'
-                ),
-                row=3, col=1
-            )
-            
-            fig.update_layout(
-                height=800,
-                showlegend=True,
-                hovermode='x unified',
-                template='plotly_dark'
-            )
-            
-            fig.update_xaxes(title_text="Time", row=3, col=1)
-            fig.update_yaxes(title_text="Price", row=1, col=1)
-            fig.update_yaxes(title_text="Z-Score", row=2, col=1)
-            fig.update_yaxes(title_text="Volume", row=3, col=1)
-            
+
+            # Only the most recent bars go over the wire; without the
+            # cap every refresh re-serializes the full history
+            display = resampled.iloc[-MAX_CHART_BARS:]
+
+            # Reuse the figure skeleton; only the trace arrays change
+            fig_key = f"fig_{symbol}"
+            if fig_key not in st.session_state:
+                st.session_state[fig_key] = build_chart_skeleton(symbol)
+            fig = st.session_state[fig_key]
+
+            with fig.batch_update():
+                fig.data[0].x = display.index
+                fig.data[0].y = display['price']
+                fig.data[1].x = display.index
+                fig.data[1].y = display['zscore']
+                fig.data[2].x = display.index
+                fig.data[2].y = display['volume']
+
             st.plotly_chart(fig, use_container_width=True)
-            
+
         except Exception as e:
             st.error(f"Error processing {symbol}: {e}")
 
-with tab2:
-    st.header("Statistical Analytics")
-    
+
+@st.fragment(run_every=effective_refresh)
+def render_analytics():
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.subheader("Summary Statistics")
-        
+
         for symbol in symbols[:2]:
-            df = st.session_state.db.get_latest_ticks(symbol.upper() if mode == "Live Stream" else symbol, limit=5000)
-            
-            if not df.empty:
-                df = df.set_index('timestamp')
-                resampled = resample_ticks(df, timeframe)
-                
-                if not resampled.empty:
-                    stats = compute_summary_stats(resampled['price'])
-                    
-                    st.markdown(f"**{symbol.upper()}**")
-                    stats_df = pd.DataFrame([stats]).T
-                    stats_df.columns = ['Value']
-                    st.dataframe(stats_df, use_container_width=True)
-    
+            resampled = get_resampled(symbol.upper() if mode == "Live Stream" else symbol, timeframe)
+
+            if not resampled.empty:
+                stats = compute_summary_stats(resampled['price'])
+
+                st.markdown(f"**{symbol.upper()}**")
+                stats_df = pd.DataFrame([stats]).T
+                stats_df.columns = ['Value']
+                st.dataframe(stats_df, use_container_width=True)
+
     with col2:
         st.subheader("ADF Stationarity Test")
-        
+
         for symbol in symbols[:2]:
-            df = st.session_state.db.get_latest_ticks(symbol.upper() if mode == "Live Stream" else symbol, limit=5000)
-            
-            if not df.empty:
-                df = df.set_index('timestamp')
-                resampled = resample_ticks(df, timeframe)
-                
-                if not resampled.empty and len(resampled) > 10:
-                    adf_result = adf_test(resampled['price'])
-                    
-                    st.markdown(f"**{symbol.upper()}**")
-                    st.metric("Test Statistic", f"{adf_result['statistic']:.4f}" if adf_result['statistic'] else "N/A")
-                    st.metric("P-Value", f"{adf_result['pvalue']:.4f}" if adf_result['pvalue'] else "N/A")
-                    st.metric(
-                        "Result", 
-                        "✅ Stationary" if adf_result['is_stationary'] else "❌ Non-stationary",
-                        delta=None
-                    )
-    
+            resampled = get_resampled(symbol.upper() if mode == "Live Stream" else symbol, timeframe)
+
+            if not resampled.empty and len(resampled) > 10:
+                fingerprint = (symbol, timeframe) + frame_fingerprint(resampled)
+                adf_result = cached_adf(fingerprint, resampled['price'])
+
+                st.markdown(f"**{symbol.upper()}**")
+                st.metric("Test Statistic", f"{adf_result['statistic']:.4f}" if adf_result['statistic'] else "N/A")
+                st.metric("P-Value", f"{adf_result['pvalue']:.4f}" if adf_result['pvalue'] else "N/A")
+                st.metric(
+                    "Result",
+                    "✅ Stationary" if adf_result['is_stationary'] else "❌ Non-stationary",
+                    delta=None
+                )
+
     # Pairs Trading Analytics
     if enable_pairs and len(symbols) >= 2:
         st.subheader("Pairs Trading Analysis")
-        
-        df_y = st.session_state.db.get_latest_ticks(symbol_y.upper() if mode == "Live Stream" else symbol_y, limit=5000)
-        df_x = st.session_state.db.get_latest_ticks(symbol_x.upper() if mode == "Live Stream" else symbol_x, limit=5000)
-        
-        if not df_y.empty and not df_x.empty:
-            df_y = df_y.set_index('timestamp')
-            df_x = df_x.set_index('timestamp')
-            
-            res_y = resample_ticks(df_y, timeframe)
-            res_x = resample_ticks(df_x, timeframe)
-            
+
+        res_y = get_resampled(symbol_y.upper() if mode == "Live Stream" else symbol_y, timeframe)
+        res_x = get_resampled(symbol_x.upper() if mode == "Live Stream" else symbol_x, timeframe)
+
+        if not res_y.empty and not res_x.empty:
             # Align timestamps
             combined = pd.merge(
                 res_y[['price']], res_x[['price']], 
                 left_index=True, right_index=True, 
                 suffixes=('_y', '_x')
             )
-            
+
             if len(combined) > 20:
-                pairs = PairsTradingAnalytics(combined['price_y'], combined['price_x'])
-                results = pairs.compute_all(window=rolling_window)
-                
-                # Spread and Z-Score Chart
-                fig = make_subplots(
-                    rows=2, cols=1,
-                    subplot_titles=('Spread', 'Z-Score'),
-                    vertical_spacing=0.15
-                )
-                
-                fig.add_trace(
-                    go.Scatter(x=results.index, y=results['spread'], mode='lines', name='Spread'),
-                    row=1, col=1
-                )
-                
-                fig.add_trace(
-                    go.Scatter(x=results.index, y=results['zscore'], mode='lines', name='Z-Score'),
-                    row=2, col=1
+                # Persist the analytics object so the hedge ratio is
+                # updated incrementally from new bars, not refit over
+                # the whole history each refresh
+                pair_key = (symbol_y, symbol_x, timeframe)
+                entry = st.session_state.pairs_analytics.get(pair_key)
+
+                if entry is None:
+                    pairs = PairsTradingAnalytics(combined['price_y'], combined['price_x'])
+                    # Seed beta up front: the metrics below read it even
+                    # when the results frame comes from cache
+                    pairs.compute_hedge_ratio()
+                    entry = {'pairs': pairs, 'last_bar': combined.index[-1]}
+                    st.session_state.pairs_analytics[pair_key] = entry
+                else:
+                    pairs = entry['pairs']
+                    new_bars = combined[combined.index > entry['last_bar']]
+                    if not new_bars.empty:
+                        pairs.update(new_bars['price_y'].to_numpy(), new_bars['price_x'].to_numpy())
+                        entry['last_bar'] = new_bars.index[-1]
+                    # Point spread/z-score computation at the refreshed series
+                    pairs.price_y = combined['price_y']
+                    pairs.price_x = combined['price_x']
+
+                fingerprint = (
+                    pair_key, rolling_window, len(combined), pairs._n,
+                    int(combined.index[-1].value),
+                    float(combined['price_y'].iat[-1]),
+                    float(combined['price_x'].iat[-1]),
                 )
-                
-                fig.add_hline(y=2, line_dash="dash", line_color="red", row=2, col=1)
-                fig.add_hline(y=-2, line_dash="dash", line_color="red", row=2, col=1)
-                
-                fig.update_layout(height=600, template='plotly_dark')
+                results = cached_pairs_results(fingerprint, pairs, rolling_window)
+
+                # Spread and Z-Score Chart (skeleton reused per pair)
+                fig_key = f"fig_pairs_{symbol_y}_{symbol_x}"
+                if fig_key not in st.session_state:
+                    st.session_state[fig_key] = build_pairs_skeleton()
+                fig = st.session_state[fig_key]
+
+                with fig.batch_update():
+                    fig.data[0].x = results.index
+                    fig.data[0].y = results['spread']
+                    fig.data[1].x = results.index
+                    fig.data[1].y = results['zscore']
+
                 st.plotly_chart(fig, use_container_width=True)
-                
+
                 # Display metrics
                 col1, col2, col3 = st.columns(3)
-                
+
                 with col1:
                     st.metric("Hedge Ratio", f"{pairs.hedge_ratio:.4f}")
-                
+
                 with col2:
                     adf = pairs.adf_test()
                     st.metric("ADF P-Value", f"{adf['p_value']:.4f}" if adf['p_value'] else "N/A")
-                
+
                 with col3:
                     corr = results['correlation'].iloc[-1]
                     st.metric("Current Correlation", f"{corr:.4f}" if not pd.isna(corr) else "N/A")
 
-with tab3:
-    st.header("Alert Monitor")
-    
+
+@st.fragment(run_every=effective_refresh)
+def render_alerts():
     triggered = st.session_state.alert_engine.get_triggered_alerts(limit=20)
-    
+
     if triggered:
         alert_df = pd.DataFrame(triggered)
         st.dataframe(alert_df, use_container_width=True)
     else:
         st.info("No alerts triggered yet")
-    
+
     if st.button("Clear Alert History"):
         st.session_state.alert_engine.clear_alerts()
         st.success("Alerts cleared")
 
-with tab4:
-    st.header("Data Export")
-    
+
+def render_export():
     export_symbol = st.selectbox("Select Symbol for Export", symbols)
     export_format = st.radio("Format", ["CSV", "Parquet"])
-    
+
     if st.button("Download Data"):
         df_export = st.session_state.db.get_latest_ticks(
             export_symbol.upper() if mode == "Live Stream" else export_symbol,
             limit=10000
         )
-        
+
         if not df_export.empty:
             if export_format == "CSV":
                 csv = df_export.to_csv(index=False)
@@ -436,20 +527,41 @@ with tab4:
         else:
             st.warning("No data to export")
 
-# Footer with status
-st.markdown("---")
-col1, col2, col3 = st.columns(3)
 
-with col1:
-    st.metric("Active Streams", len(st.session_state.ws_clients))
+@st.fragment(run_every=effective_refresh)
+def render_status_footer():
+    col1, col2, col3 = st.columns(3)
 
-with col2:
-    total_ticks = sum(len(ws.get_ticks()) for ws in st.session_state.ws_clients.values())
-    st.metric("Total Ticks Collected", total_ticks)
+    with col1:
+        st.metric("Active Streams", len(st.session_state.ws_clients))
 
-with col3:
-    st.metric("Last Update", datetime.now().strftime("%H:%M:%S"))
+    with col2:
+        total_ticks = sum(ws.tick_count() for ws in st.session_state.ws_clients.values())
+        st.metric("Total Ticks Collected", total_ticks)
 
-# Auto-refresh
-time.sleep(refresh_rate)
-st.rerun()
+    with col3:
+        st.metric("Last Update", datetime.now().strftime("%H:%M:%S"))
+
+
+# Watches stream activity; ingestion runs inside the collectors
+monitor_stream()
+
+with tab1:
+    st.header("Real-Time Charts")
+    render_charts()
+
+with tab2:
+    st.header("Statistical Analytics")
+    render_analytics()
+
+with tab3:
+    st.header("Alert Monitor")
+    render_alerts()
+
+with tab4:
+    st.header("Data Export")
+    render_export()
+
+# Footer with status
+st.markdown("---")
+render_status_footer()
@@ -1,70 +1,258 @@
 import asyncio
-import json
+import orjson
+import msgspec
 import websockets
-from datetime import datetime
+from datetime import datetime, timezone
 import threading
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+class Trade(msgspec.Struct):
+    """Fields of the Binance trade payload the collector consumes"""
+    T: int  # trade time (epoch ms)
+    s: str  # symbol
+    p: str  # price
+    q: str  # quantity
+
+
+# Decodes straight into the fixed-layout struct: no per-message dict
+_trade_decoder = msgspec.json.Decoder(Trade)
+
 
 class BinanceWebSocket:
     """
     Thread-safe Binance WebSocket client that runs in background.
+
+    Ticks are stored column-wise (struct-of-arrays) in preallocated
+    NumPy buffers instead of a list of dicts, so consumers get cheap
+    DataFrame snapshots built on array views rather than paying a
+    dict-to-DataFrame conversion per refresh.
+
+    The buffers grow geometrically up to MAX_TICKS and then wrap as a
+    ring, so memory and per-snapshot work stay bounded no matter how
+    long the stream runs.
     """
-    
-    def __init__(self):
-        self.ticks = []
+
+    _INITIAL_CAPACITY = 65536
+
+    # Ring capacity: oldest ticks are overwritten past this point
+    MAX_TICKS = 200_000
+
+    # Seconds between background flushes into the tick store
+    FLUSH_INTERVAL_S = 0.25
+
+    def __init__(self, store=None):
+        self._timestamps = np.empty(self._INITIAL_CAPACITY, dtype='int64')  # epoch ns
+        self._prices = np.empty(self._INITIAL_CAPACITY, dtype='float64')
+        self._qtys = np.empty(self._INITIAL_CAPACITY, dtype='float64')
+        self._count = 0
+        self._read_cursor = 0
+        self._lock = threading.Lock()
+        self.symbol = None
+        self.store = store
         self.running = False
         self.thread = None
         self.loop = None
-        
+
     def start(self, symbol: str):
         """Start WebSocket in background thread"""
         if self.running:
             return
-        
+
         self.running = True
         self.thread = threading.Thread(target=self._run, args=(symbol,), daemon=True)
         self.thread.start()
-        
+
     def _run(self, symbol: str):
         """Run async event loop in thread"""
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
+        if self.store is not None:
+            # Flushing lives next to the stream, so durability doesn't
+            # depend on the UI refresh cadence
+            self.loop.create_task(self._flush_loop())
         self.loop.run_until_complete(self._stream_trades(symbol))
-        
+
+    async def _flush_loop(self):
+        """Batch pending ticks into the store every FLUSH_INTERVAL_S"""
+        cursor = self.store._cursor()
+        pending = None
+        while self.running:
+            await asyncio.sleep(self.FLUSH_INTERVAL_S)
+
+            batch = self.drain_table()
+            if pending is not None:
+                # Re-attempt ticks whose insert failed last cycle
+                batch = pending if batch is None else pa.concat_tables([pending, batch])
+                pending = None
+            if batch is None:
+                continue
+
+            try:
+                self.store.insert_ticks(batch, conn=cursor)
+            except Exception as e:
+                # Keep the drained batch for the next cycle instead of
+                # dropping it (e.g. transient catalog conflicts)
+                pending = batch
+                print(f"Flush error (will retry): {e}")
+
+    def _append(self, ts_ns: int, price: float, qty: float):
+        """Append one tick, growing geometrically up to the ring capacity"""
+        with self._lock:
+            capacity = self._timestamps.size
+            if self._count == capacity and capacity < self.MAX_TICKS:
+                new_capacity = min(capacity * 2, self.MAX_TICKS)
+                self._timestamps = np.resize(self._timestamps, new_capacity)
+                self._prices = np.resize(self._prices, new_capacity)
+                self._qtys = np.resize(self._qtys, new_capacity)
+                capacity = new_capacity
+
+            pos = self._count % capacity
+            self._timestamps[pos] = ts_ns
+            self._prices[pos] = price
+            self._qtys[pos] = qty
+            self._count += 1
+
+    def _slice(self, arr: np.ndarray, lo: int, hi: int) -> np.ndarray:
+        """View (or wrap-around copy) of ring positions for ticks [lo:hi]"""
+        capacity = arr.size
+        pos = lo % capacity
+        length = hi - lo
+        if pos + length <= capacity:
+            return arr[pos:pos + length]
+        head = capacity - pos
+        return np.concatenate((arr[pos:], arr[:length - head]))
+
     async def _stream_trades(self, symbol: str):
         """Connect to Binance WebSocket and stream trades"""
         url = f"wss://fstream.binance.com/ws/{symbol}@trade"
         print(f"Connecting to {url}")
-        
+
         try:
             async with websockets.connect(url) as ws:
                 async for message in ws:
                     if not self.running:
                         break
-                        
-                    data = json.loads(message)
-                    tick = {
-                        "timestamp": datetime.utcfromtimestamp(data["T"] / 1000),
-                        "symbol": data["s"],
-                        "price": float(data["p"]),
-                        "qty": float(data["q"]),
-                    }
-                    self.ticks.append(tick)
-                    
-                    if len(self.ticks) % 100 == 0:
-                        print(f"Collected {len(self.ticks)} ticks")
+
+                    trade = _trade_decoder.decode(message)
+                    if self.symbol is None:
+                        self.symbol = trade.s
+
+                    self._append(
+                        trade.T * 1_000_000,  # ms -> ns
+                        float(trade.p),
+                        float(trade.q),
+                    )
+
+                    if self._count % 100 == 0:
+                        print(f"Collected {self._count} ticks")
         except Exception as e:
             print(f"WebSocket error: {e}")
-            
-    def get_ticks(self):
-        """Get all collected ticks"""
-        return self.ticks.copy()
-    
+
+    def _range_frame(self, lo: int, hi: int) -> pd.DataFrame:
+        """Build a DataFrame from ring positions for ticks [lo:hi]"""
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(self._slice(self._timestamps, lo, hi), unit='ns'),
+            'symbol': self.symbol,
+            'price': self._slice(self._prices, lo, hi).copy(),
+            'qty': self._slice(self._qtys, lo, hi).copy(),
+        })
+
+    def snapshot(self, start: int = 0) -> pd.DataFrame:
+        """
+        Return ticks [start:] as a DataFrame without consuming them.
+
+        Ticks older than the ring capacity are gone; start is clamped
+        accordingly.
+        """
+        with self._lock:
+            n = self._count
+            if self.symbol is None or start >= n:
+                return pd.DataFrame()
+
+            lo = max(start, n - self._timestamps.size)
+            return self._range_frame(lo, n)
+
+    def drain(self) -> pd.DataFrame:
+        """
+        Atomically return all ticks not yet drained and mark them consumed.
+
+        Each tick is handed out exactly once, so per-call cost is
+        O(new ticks) and the caller can insert the result directly
+        without duplicate checks.
+        """
+        with self._lock:
+            n = self._count
+            if self.symbol is None or self._read_cursor >= n:
+                return pd.DataFrame()
+
+            lo = max(self._read_cursor, n - self._timestamps.size)
+            self._read_cursor = n
+            return self._range_frame(lo, n)
+
+    def drain_table(self) -> pa.Table:
+        """
+        Drain pending ticks as a pyarrow Table (None when nothing is
+        pending).
+
+        The numeric columns wrap the ring slices without a pandas
+        round-trip, so a DuckDB insert of the result reads the Arrow
+        buffers in place.
+        """
+        with self._lock:
+            n = self._count
+            if self.symbol is None or self._read_cursor >= n:
+                return None
+
+            lo = max(self._read_cursor, n - self._timestamps.size)
+            self._read_cursor = n
+
+            length = n - lo
+            return pa.table({
+                'timestamp': pa.array(self._slice(self._timestamps, lo, n).copy()).cast(pa.timestamp('ns')),
+                'symbol': pa.array([self.symbol] * length),
+                'price': pa.array(self._slice(self._prices, lo, n).copy()),
+                'qty': pa.array(self._slice(self._qtys, lo, n).copy()),
+            })
+
+    def pending_count(self) -> int:
+        """Number of collected ticks not yet drained"""
+        return self._count - self._read_cursor
+
+    def tick_count(self) -> int:
+        """Number of ticks collected so far"""
+        return self._count
+
     def stop(self):
         """Stop WebSocket"""
         self.running = False
 
 
+# Module-level client registry: survives Streamlit reruns and is shared
+# across sessions, so each symbol gets exactly one WebSocket connection
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(symbol: str, store=None) -> BinanceWebSocket:
+    """
+    Return the shared client for a symbol, starting its stream once.
+
+    When a TickStore is supplied the client flushes its ticks into it
+    from a background timer, so consumers only ever read.
+    """
+    with _clients_lock:
+        client = _clients.get(symbol)
+        if client is None:
+            client = BinanceWebSocket(store=store)
+            client.start(symbol)
+            _clients[symbol] = client
+        return client
+
+
 async def stream_trades(symbol: str, tick_buffer: list):
     """
     Legacy function for backward compatibility.
@@ -75,10 +263,10 @@ async def stream_trades(symbol: str, tick_buffer: list):
 
     async with websockets.connect(url) as ws:
         async for message in ws:
-            data = json.loads(message)
+            data = orjson.loads(message)
 
             tick = {
-                "timestamp": datetime.utcfromtimestamp(data["T"] / 1000),
+                "timestamp": datetime.fromtimestamp(data["T"] / 1000, tz=timezone.utc),
                 "symbol": data["s"],
                 "price": float(data["p"]),
                 "qty": float(data["q"]),
@@ -1,77 +1,318 @@
 import pandas as pd
+import pyarrow as pa
 import duckdb
 import os
+import time
+import threading
 
 
 class TickStore:
     """
     DuckDB-based storage for tick data with efficient querying.
+
+    A daemon thread periodically archives ticks older than the
+    retention window to partitioned Parquet files and deletes them
+    from the hot table, so per-query cost stops degrading as the
+    stream runs.
     """
-    
-    def __init__(self, db_path="data/ticks.db"):
+
+    # Seconds between retention sweeps
+    _RETENTION_CHECK_S = 60
+
+    def __init__(self, db_path="data/ticks.db", retention_days=1,
+                 archive_dir="data/parquet"):
         """Initialize DuckDB connection"""
         # Create directory if needed
         db_dir = os.path.dirname(db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
-        
+
         # Use shared connection to avoid locking issues
         self.db_path = db_path
         self.conn = duckdb.connect(db_path, read_only=False)
+        # Let DuckDB parallelize scans/sorts and keep parsed objects
+        # cached across the repeated per-refresh queries
+        self.conn.execute(f"PRAGMA threads={os.cpu_count() or 4}")
+        self.conn.execute("PRAGMA enable_object_cache")
+        # Bound memory and spill predictably instead of at DuckDB's
+        # machine-dependent defaults
+        temp_dir = os.path.join(db_dir or "data", "tmp")
+        os.makedirs(temp_dir, exist_ok=True)
+        self.conn.execute("PRAGMA memory_limit='1GB'")
+        self.conn.execute(f"PRAGMA temp_directory='{temp_dir}'")
+        self.conn.execute("PRAGMA enable_progress_bar=false")
         self._create_tables()
+
+        self.retention_days = retention_days
+        self.archive_dir = archive_dir
+        self._retention_thread = threading.Thread(
+            target=self._retention_loop, daemon=True
+        )
+        self._retention_thread.start()
         
     def _create_tables(self):
         """Create tick data table"""
+        # symbol is a 1-byte dictionary-encoded enum rather than
+        # VARCHAR: equality filters and grouping become integer
+        # compares. The type grows lazily (see _ensure_symbols)
+        self.conn.execute("""
+            CREATE TYPE IF NOT EXISTS symbol_t AS ENUM ('BTCUSDT', 'ETHUSDT')
+        """)
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS ticks (
                 timestamp TIMESTAMP,
-                symbol VARCHAR,
+                symbol symbol_t,
                 price DOUBLE,
                 qty DOUBLE
             )
         """)
+        # Composite index so per-symbol latest-N queries are an index
+        # range scan instead of a full scan + sort of the whole table
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_ticks_sym_ts
+            ON ticks(symbol, timestamp)
+        """)
+        self._known_symbols = {
+            row[0] for row in
+            self.conn.execute("SELECT unnest(enum_range(NULL::symbol_t))").fetchall()
+        }
+
+    def _ensure_symbols(self, symbols, conn=None):
+        """
+        Grow the symbol enum for any previously unseen symbols.
+
+        DuckDB has no ALTER TYPE ... ADD VALUE, so the type is rebuilt
+        and the column retyped through a temporary name (the dependent
+        index is dropped and recreated around the retype). This runs
+        once per new symbol, not per insert.
+        """
+        new = set(symbols) - self._known_symbols
+        if not new:
+            return
+
+        conn = conn or self.conn
+        quoted = ", ".join(
+            "'{}'".format(s.replace("'", "''"))
+            for s in sorted(self._known_symbols | new)
+        )
+        conn.execute("DROP INDEX IF EXISTS idx_ticks_sym_ts")
+        conn.execute(f"CREATE TYPE _symbol_t_grow AS ENUM ({quoted})")
+        conn.execute("ALTER TABLE ticks ALTER COLUMN symbol SET DATA TYPE _symbol_t_grow")
+        conn.execute("DROP TYPE symbol_t")
+        conn.execute(f"CREATE TYPE symbol_t AS ENUM ({quoted})")
+        conn.execute("ALTER TABLE ticks ALTER COLUMN symbol SET DATA TYPE symbol_t")
+        conn.execute("DROP TYPE _symbol_t_grow")
+        conn.execute("""
+            CREATE INDEX idx_ticks_sym_ts ON ticks(symbol, timestamp)
+        """)
+        self._known_symbols |= new
         
-    def insert_ticks(self, ticks: list):
-        """Insert list of tick dictionaries"""
+    # Below this row count a prepared-statement batch beats building
+    # an Arrow table
+    _EXECUTEMANY_MAX = 500
+
+    def insert_ticks(self, ticks, conn=None):
+        """
+        Insert ticks from an Arrow table, DataFrame, or list of dicts.
+
+        Callers on other threads pass their own cursor (see _cursor)
+        as conn.
+        """
+        if isinstance(ticks, pa.Table):
+            if ticks.num_rows:
+                self._ensure_symbols(ticks.column('symbol').unique().to_pylist(), conn=conn)
+                self._insert_arrow(ticks, conn=conn)
+            return
+
+        if isinstance(ticks, pd.DataFrame):
+            self.insert_dataframe(ticks, conn=conn)
+            return
+
         if not ticks:
             return
-            
-        df = pd.DataFrame(ticks)
-        self.conn.execute("INSERT INTO ticks SELECT * FROM df")
+
+        self._ensure_symbols({t['symbol'] for t in ticks}, conn=conn)
+
+        if len(ticks) < self._EXECUTEMANY_MAX:
+            (conn or self.conn).executemany(
+                "INSERT INTO ticks VALUES (?, ?, ?, ?)",
+                [(t['timestamp'], t['symbol'], t['price'], t['qty']) for t in ticks]
+            )
+            return
+
+        # Large batches: stream columnar Arrow buffers straight into
+        # DuckDB, skipping pandas dtype inference entirely
+        self._insert_arrow(pa.table({
+            'timestamp': pa.array([t['timestamp'] for t in ticks], type=pa.timestamp('us')),
+            'symbol': pa.array([t['symbol'] for t in ticks]),
+            'price': pa.array([t['price'] for t in ticks], type=pa.float64()),
+            'qty': pa.array([t['qty'] for t in ticks], type=pa.float64()),
+        }), conn=conn)
+
+    def insert_dataframe(self, df: pd.DataFrame, conn=None):
+        """
+        Insert a tick DataFrame (timestamp, symbol, price, qty columns)
+        via Arrow, letting DuckDB read the columnar buffers in place.
+        """
+        if df.empty:
+            return
+        self._ensure_symbols(df['symbol'].unique(), conn=conn)
+        self._insert_arrow(pa.Table.from_pandas(df, preserve_index=False), conn=conn)
+
+    def _insert_arrow(self, batch: pa.Table, conn=None):
+        """Register an Arrow batch so DuckDB scans its buffers in place"""
+        conn = conn or self.conn
+        conn.register('_arrow_batch', batch)
+        conn.execute("INSERT INTO ticks SELECT * FROM _arrow_batch")
+        conn.unregister('_arrow_batch')
         
     def get_ticks(self, symbol=None, start_time=None, end_time=None):
         """Query ticks with optional filters"""
-        query = "SELECT * FROM ticks WHERE 1=1"
-        
+        clauses = []
+        params = []
+
         if symbol:
-            query += f" AND symbol = '{symbol}'"
+            clauses.append("symbol = ?")
+            params.append(symbol)
         if start_time:
-            query += f" AND timestamp >= '{start_time}'"
+            clauses.append("timestamp >= ?")
+            params.append(start_time)
         if end_time:
-            query += f" AND timestamp <= '{end_time}'"
-            
+            clauses.append("timestamp <= ?")
+            params.append(end_time)
+
+        query = "SELECT * FROM ticks"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
         query += " ORDER BY timestamp"
-        
-        return self.conn.execute(query).df()
-    
+
+        return self.conn.execute(query, params).df()
+
     def get_latest_ticks(self, symbol, limit=1000):
         """Get most recent ticks for a symbol"""
-        query = f"""
-            SELECT * FROM ticks 
-            WHERE symbol = '{symbol}'
-            ORDER BY timestamp DESC 
-            LIMIT {limit}
-        """
-        df = self.conn.execute(query).df()
+        df = self.conn.execute(
+            """
+            SELECT * FROM ticks
+            WHERE symbol = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            [symbol, limit]
+        ).df()
         return df.sort_values('timestamp')
     
+    # Supported bar widths for SQL-side resampling
+    _FREQ_INTERVALS = {
+        '1s': '1 second',
+        '1m': '1 minute',
+        '5m': '5 minutes',
+    }
+
+    def get_resampled(self, symbol, freq, limit=1000):
+        """
+        Aggregate ticks into price/volume bars inside DuckDB.
+
+        Only the finished bars cross the DuckDB/Python boundary instead
+        of the raw ticks plus a pandas groupby. Returns a frame indexed
+        by bar start, oldest first.
+        """
+        interval = self._FREQ_INTERVALS.get(freq)
+        if interval is None:
+            raise ValueError("Invalid timeframe")
+
+        df = self.conn.execute(
+            f"""
+            SELECT * FROM (
+                SELECT
+                    time_bucket(INTERVAL '{interval}', timestamp) AS timestamp,
+                    last(price ORDER BY timestamp) AS price,
+                    sum(qty) AS volume
+                FROM ticks
+                WHERE symbol = ?
+                GROUP BY 1
+                ORDER BY 1 DESC
+                LIMIT ?
+            )
+            ORDER BY timestamp
+            """,
+            [symbol, limit]
+        ).df()
+        return df.set_index('timestamp')
+
     def clear_old_data(self, days=1):
         """Delete data older than N days"""
         self.conn.execute(f"""
-            DELETE FROM ticks 
+            DELETE FROM ticks
             WHERE timestamp < NOW() - INTERVAL '{days} days'
         """)
+
+    def _cursor(self):
+        """
+        Cursor over the shared connection for use from other threads.
+
+        The connection itself is only safe on the thread that created
+        it; every background thread must go through its own cursor.
+        """
+        return self.conn.cursor()
+
+    def _retention_loop(self):
+        """Periodically archive and drop ticks past the retention window"""
+        cursor = self._cursor()
+        while True:
+            time.sleep(self._RETENTION_CHECK_S)
+            try:
+                self._archive_expired(cursor)
+            except Exception as e:
+                print(f"Retention error: {e}")
+
+    def _archive_expired(self, cursor):
+        """Copy expired ticks to partitioned Parquet, then delete them"""
+        cutoff = f"NOW() - INTERVAL '{self.retention_days} days'"
+        expired = cursor.execute(
+            f"SELECT count(*) FROM ticks WHERE timestamp < {cutoff}"
+        ).fetchone()[0]
+        if not expired:
+            return
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        cursor.execute(f"""
+            COPY (SELECT * FROM ticks WHERE timestamp < {cutoff})
+            TO '{self.archive_dir}' (FORMAT PARQUET, PARTITION_BY (symbol), APPEND)
+        """)
+        cursor.execute(f"DELETE FROM ticks WHERE timestamp < {cutoff}")
+        # Shrink the WAL after the bulk delete
+        cursor.execute("CHECKPOINT")
         
+    def get_summary(self, symbol, limit=5000):
+        """
+        One-row price summary over the most recent ticks, computed
+        inside DuckDB instead of materializing the rows into Python.
+
+        Returns:
+            Dictionary with count/mean/std/min/max/median/skew/kurtosis
+        """
+        row = self.conn.execute(
+            """
+            SELECT
+                count(*) AS count,
+                avg(price) AS mean,
+                stddev_samp(price) AS std,
+                min(price) AS min,
+                max(price) AS max,
+                median(price) AS median,
+                skewness(price) AS skew,
+                kurtosis(price) AS kurtosis
+            FROM (
+                SELECT price FROM ticks
+                WHERE symbol = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            )
+            """,
+            [symbol, limit]
+        ).df()
+        return row.iloc[0].to_dict()
+
     def get_symbols(self):
         """Get list of all symbols in database"""
         result = self.conn.execute("SELECT DISTINCT symbol FROM ticks").fetchall()